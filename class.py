@@ -1,6 +1,28 @@
+import bisect
+import heapq
+import re
+import sys
+from itertools import pairwise
+from operator import attrgetter
+
+
+# Separators between the parts of an emperor's name, e.g. "Augustus (Octavian)"
+_NAME_SEPARATORS = re.compile(r"[\s()]+")
+# Name parts too common to identify an emperor, e.g. "Constantine the Great"
+_NAME_STOPWORDS = frozenset({"the", "of"})
+
+
 class RomanEmperor:
     """Class representing a Roman Emperor with relevant historical information."""
     
+    __slots__ = ('name', 'birth', 'death', 'reign_start', 'reign_end', 'dynasty',
+                 'notable_achievements', 'cause_of_death', 'predecessor', '_successor',
+                 'wives', 'zodiac', '_empire', '_reign_duration', '_age_at_death', '_age_at_accession',
+                 '_n_achievements', '_name_lower', '_wives_lower', '_cause_lower', '_str_cache')
+    
+    # Shared by every emperor without wives or achievements
+    _EMPTY = ()
+    
     def __init__(self, name, birth, death, reign_start, reign_end, dynasty=None, 
                  notable_achievements=None, cause_of_death=None, predecessor=None, successor=None,
                  wives=None, zodiac=None):
@@ -9,50 +31,86 @@ class RomanEmperor:
         self.death = death
         self.reign_start = reign_start
         self.reign_end = reign_end
-        self.dynasty = dynasty
-        self.notable_achievements = notable_achievements or []
+        self.dynasty = sys.intern(dynasty) if dynasty else None
+        self.notable_achievements = tuple(notable_achievements) if notable_achievements else self._EMPTY
         self.cause_of_death = cause_of_death
         self.predecessor = predecessor
-        self.successor = successor
-        self.wives = wives or []
-        self.zodiac = zodiac
+        self._successor = successor
+        self._empire = None
+        self.wives = tuple(wives) if wives else self._EMPTY
+        self.zodiac = sys.intern(zodiac) if zodiac else None
         
+        # Derived values are fixed once the emperor is constructed
+        self._reign_duration = reign_end - reign_start
+        self._age_at_death = death - birth
+        self._age_at_accession = reign_start - birth
+        self._n_achievements = len(self.notable_achievements)
+        
+        # Lowercased search keys, so lookups only lowercase the query
+        self._name_lower = name.lower()
+        self._wives_lower = tuple(wife.lower() for wife in self.wives)
+        self._cause_lower = cause_of_death.lower() if cause_of_death else None
+        self._str_cache = None
+        
+    @property
+    def successor(self):
+        """The next emperor.
+        
+        Once the emperor belongs to an empire, the link lives in that empire's
+        successor index and assignments write there. The successor= argument
+        is only a fallback until the empire records a link.
+        """
+        if self._empire is not None:
+            successor = self._empire.successor_of(self)
+            if successor is not None:
+                return successor
+        return self._successor
+    
+    @successor.setter
+    def successor(self, successor):
+        if self._empire is not None:
+            self._empire.set_successor(self, successor)
+        else:
+            self._successor = successor
+    
+    def __reduce__(self):
+        """Pickle the constructor arguments only; derived fields are recomputed."""
+        return (RomanEmperor, (self.name, self.birth, self.death, self.reign_start, self.reign_end,
+                               self.dynasty, self.notable_achievements, self.cause_of_death,
+                               self.predecessor, self._successor, self.wives, self.zodiac))
+    
     def reign_duration(self):
         """Calculate the duration of the emperor's reign in years."""
-        return self.reign_end - self.reign_start
+        return self._reign_duration
     
     def age_at_death(self):
         """Calculate the emperor's age at death."""
-        return self.death - self.birth
+        return self._age_at_death
     
     def age_at_accession(self):
         """Calculate the emperor's age when they became emperor."""
-        return self.reign_start - self.birth
+        return self._age_at_accession
     
     def __str__(self):
         """String representation of the emperor."""
-        info = [
-            f"Name: {self.name}",
-            f"Lived: {self.birth} CE - {self.death} CE (Age: {self.age_at_death()} years)",
-            f"Reign: {self.reign_start} CE - {self.reign_end} CE ({self.reign_duration()} years)",
-            f"Dynasty: {self.dynasty}" if self.dynasty else "Dynasty: None",
-            f"Zodiac Sign: {self.zodiac}" if self.zodiac else "Zodiac Sign: Unknown"
-        ]
-        
-        if self.wives:
-            info.append("Wives/Consorts:")
-            for wife in self.wives:
-                info.append(f"  - {wife}")
-        
-        if self.notable_achievements:
-            info.append("Notable Achievements:")
-            for achievement in self.notable_achievements:
-                info.append(f"  - {achievement}")
-                
-        if self.cause_of_death:
-            info.append(f"Cause of Death: {self.cause_of_death}")
+        if self._str_cache is None:
+            wives_block = ("\nWives/Consorts:\n" + "\n".join(f"  - {wife}" for wife in self.wives)
+                           if self.wives else "")
+            achievements_block = ("\nNotable Achievements:\n"
+                                  + "\n".join(f"  - {achievement}" for achievement in self.notable_achievements)
+                                  if self.notable_achievements else "")
+            death_block = f"\nCause of Death: {self.cause_of_death}" if self.cause_of_death else ""
             
-        return "\n".join(info)
+            # Fields are not reassigned after construction, so the text is built once
+            self._str_cache = (
+                f"Name: {self.name}\n"
+                f"Lived: {self.birth} CE - {self.death} CE (Age: {self._age_at_death} years)\n"
+                f"Reign: {self.reign_start} CE - {self.reign_end} CE ({self._reign_duration} years)\n"
+                f"Dynasty: {self.dynasty or 'None'}\n"
+                f"Zodiac Sign: {self.zodiac or 'Unknown'}"
+                f"{wives_block}{achievements_block}{death_block}"
+            )
+        return self._str_cache
 
 
 class RomanEmpire:
@@ -61,70 +119,204 @@ class RomanEmpire:
     def __init__(self):
         self.emperors = []
         self.dynasties = set()
+        self._by_dynasty = {}
+        self._by_zodiac = {}
+        self._assassinated = []
+        # Successor links as positions in self.emperors (None if unknown)
+        self._successor_idx = []
+        self._positions = {}
+        # Year index, rebuilt lazily by _build_year_index (None when stale)
+        self._starts = None
+        self._ends = None
+        self._max_end_up_to = None
+        # Lowercased full names and name tokens, e.g. "augustus" and "octavian",
+        # with (key, position) pairs kept sorted for prefix lookups
+        self._name_index = {}
+        self._name_keys = []
         
     def add_emperor(self, emperor):
         """Add an emperor to the empire."""
-        self.emperors.append(emperor)
-        if emperor.dynasty:
-            self.dynasties.add(emperor.dynasty)
+        self.add_emperors((emperor,))
+    
+    def add_emperors(self, emperors):
+        """Add several emperors to the empire in order."""
+        # Bind the bookkeeping methods once rather than per emperor
+        append = self.emperors.append
+        append_successor = self._successor_idx.append
+        positions = self._positions
+        dynasty_add = self.dynasties.add
+        append_assassinated = self._assassinated.append
+        by_dynasty = self._by_dynasty
+        by_zodiac = self._by_zodiac
+        index_name = self._index_name
+        
+        self._starts = self._ends = self._max_end_up_to = None
+        position = len(self.emperors)
+        for emperor in emperors:
+            positions[emperor] = position
+            # The first empire an emperor joins resolves its successor property
+            if emperor._empire is None:
+                emperor._empire = self
+            append(emperor)
+            append_successor(None)
+            dynasty = emperor.dynasty
+            if dynasty:
+                dynasty_add(dynasty)
+                by_dynasty.setdefault(dynasty, []).append(emperor)
+            zodiac = emperor.zodiac
+            if zodiac:
+                by_zodiac.setdefault(zodiac, []).append(emperor)
+            cause_lower = emperor._cause_lower
+            if cause_lower and "assassinated" in cause_lower:
+                append_assassinated(emperor)
+            index_name(emperor, position)
+            position += 1
+    
+    def _index_name(self, emperor, position):
+        """Index an emperor's lowercased full name and name parts."""
+        name_lower = emperor._name_lower
+        for key in [name_lower] + _NAME_SEPARATORS.split(name_lower):
+            if key and key not in self._name_index and key not in _NAME_STOPWORDS:
+                self._name_index[key] = emperor
+                bisect.insort(self._name_keys, (key, position))
+    
+    def __getstate__(self):
+        """Pickle only the emperors and successor links; the indexes are derived."""
+        return {'emperors': self.emperors, 'successor_idx': self._successor_idx}
+    
+    def __setstate__(self, state):
+        """Restore a pickled empire, rebuilding its indexes and back-references."""
+        self.__init__()
+        self.add_emperors(state['emperors'])
+        self._successor_idx[:] = state['successor_idx']
+    
+    def link_chain(self, emperors):
+        """Record each emperor in the list as the successor of the one before."""
+        for emperor, successor in pairwise(emperors):
+            self.set_successor(emperor, successor)
+    
+    def set_successor(self, emperor, successor):
+        """Record successor (or None) as the emperor who came after emperor."""
+        position = self._position_of(successor) if successor is not None else None
+        self._successor_idx[self._position_of(emperor)] = position
+        if emperor._empire is self:
+            # The index is now the only record of this emperor's successor
+            emperor._successor = None
+    
+    def successor_of(self, emperor):
+        """Get the emperor who succeeded the given one, if known."""
+        i = self._successor_idx[self._position_of(emperor)]
+        return self.emperors[i] if i is not None else None
+    
+    def _position_of(self, emperor):
+        """Get an emperor's position in self.emperors."""
+        position = self._positions.get(emperor)
+        if position is None:
+            raise ValueError(f"{emperor.name} has not been added to this empire")
+        return position
     
     def get_emperor_by_name(self, name):
-        """Find an emperor by name (case-insensitive partial match)."""
+        """Find an emperor by name (case-insensitive partial match).
+        
+        Exact name or name-part matches win, then prefix matches, then any substring.
+        """
+        needle = name.lower()
+        if needle:
+            emperor = self._name_index.get(needle)
+            if emperor is not None:
+                return emperor
+            # Among all keys sharing the prefix, prefer the earliest-added emperor
+            first = None
+            keys = self._name_keys
+            i = bisect.bisect_left(keys, (needle,))
+            while i < len(keys) and keys[i][0].startswith(needle):
+                position = keys[i][1]
+                if first is None or position < first:
+                    first = position
+                i += 1
+            if first is not None:
+                return self.emperors[first]
         for emperor in self.emperors:
-            if name.lower() in emperor.name.lower():
+            if needle in emperor._name_lower:
                 return emperor
         return None
     
+    def _build_year_index(self):
+        """Build the reign-start index used by get_emperor_by_year."""
+        order = sorted(range(len(self.emperors)), key=lambda i: self.emperors[i].reign_start)
+        ends = [(self.emperors[i].reign_end, i) for i in order]
+        # Running maximum of reign_end, so the backwards walk can stop early
+        max_end_up_to = []
+        max_end = None
+        for end, _ in ends:
+            max_end = end if max_end is None else max(max_end, end)
+            max_end_up_to.append(max_end)
+        self._ends = ends
+        self._max_end_up_to = max_end_up_to
+        # Set last: get_emperor_by_year treats _starts as the "index built" flag
+        self._starts = [self.emperors[i].reign_start for i in order]
+    
     def get_emperor_by_year(self, year):
         """Find the emperor(s) who ruled during a specific year."""
-        ruling_emperors = []
-        for emperor in self.emperors:
-            if emperor.reign_start <= year <= emperor.reign_end:
-                ruling_emperors.append(emperor)
-        return ruling_emperors
+        if self._starts is None:
+            self._build_year_index()
+        positions = []
+        i = bisect.bisect_right(self._starts, year)
+        while i > 0 and self._max_end_up_to[i - 1] >= year:
+            i -= 1
+            end, position = self._ends[i]
+            if end >= year:
+                positions.append(position)
+        return [self.emperors[position] for position in sorted(positions)]
     
     def get_emperors_by_dynasty(self, dynasty):
         """Get all emperors belonging to a specific dynasty."""
-        return [emperor for emperor in self.emperors if emperor.dynasty == dynasty]
+        if not dynasty or not isinstance(dynasty, str):
+            # Only non-empty string dynasty values are indexed
+            return [emperor for emperor in self.emperors if emperor.dynasty == dynasty]
+        return list(self._by_dynasty.get(dynasty, []))
     
     def get_emperors_by_period(self, start_year, end_year):
         """Get all emperors who reigned during a specific period."""
-        return [emperor for emperor in self.emperors 
-                if not (emperor.reign_end < start_year or emperor.reign_start > end_year)]
+        return [emperor for emperor in self.emperors
+                if emperor.reign_end >= start_year and emperor.reign_start <= end_year]
     
     def get_emperors_by_zodiac(self, zodiac_sign):
         """Get all emperors with a specific zodiac sign."""
-        return [emperor for emperor in self.emperors if emperor.zodiac == zodiac_sign]
+        if not zodiac_sign or not isinstance(zodiac_sign, str):
+            # Only non-empty string zodiac values are indexed
+            return [emperor for emperor in self.emperors if emperor.zodiac == zodiac_sign]
+        return list(self._by_zodiac.get(zodiac_sign, []))
+    
+    def group_by_zodiac(self):
+        """Get all emperors grouped by zodiac sign."""
+        return {sign: list(emperors) for sign, emperors in self._by_zodiac.items()}
     
     def get_longest_reigning(self, top_n=1):
         """Get the top N longest-reigning emperors."""
-        return sorted(self.emperors, key=lambda x: x.reign_duration(), reverse=True)[:top_n]
+        return heapq.nlargest(top_n, self.emperors, key=attrgetter('_reign_duration'))
     
     def get_shortest_reigning(self, top_n=1):
         """Get the top N shortest-reigning emperors."""
-        return sorted(self.emperors, key=lambda x: x.reign_duration())[:top_n]
+        return heapq.nsmallest(top_n, self.emperors, key=attrgetter('_reign_duration'))
     
     def get_oldest_at_death(self, top_n=1):
         """Get the top N oldest emperors at death."""
-        return sorted(self.emperors, key=lambda x: x.age_at_death(), reverse=True)[:top_n]
+        return heapq.nlargest(top_n, self.emperors, key=attrgetter('_age_at_death'))
     
     def get_youngest_at_accession(self, top_n=1):
         """Get the top N youngest emperors at accession."""
-        return sorted(self.emperors, key=lambda x: x.age_at_accession())[:top_n]
+        return heapq.nsmallest(top_n, self.emperors, key=attrgetter('_age_at_accession'))
     
     def get_most_achievements(self, top_n=1):
         """Get the top N emperors with the most notable achievements."""
-        return sorted(self.emperors, key=lambda x: len(x.notable_achievements), reverse=True)[:top_n]
+        return heapq.nlargest(top_n, self.emperors, key=attrgetter('_n_achievements'))
         
     def get_emperors_by_wife(self, wife_name):
         """Get all emperors who were married to a woman with the given name."""
-        emperors_with_wife = []
-        for emperor in self.emperors:
-            for wife in emperor.wives:
-                if wife_name.lower() in wife.lower():
-                    emperors_with_wife.append(emperor)
-                    break
-        return emperors_with_wife
+        needle = wife_name.lower()
+        return [emperor for emperor in self.emperors
+                if any(needle in wife for wife in emperor._wives_lower)]
 
 
 def create_roman_empire():
@@ -582,29 +774,16 @@ def create_roman_empire():
         zodiac="Pisces"
     )
     
+    # Emperors linked by direct succession, in order
+    succession = [augustus, tiberius, caligula, claudius, nero, galba, otho, vitellius,
+                  vespasian, titus, domitian, nerva, trajan, hadrian, antoninus_pius,
+                  marcus_aurelius, commodus]
+    
     # Add all emperors to the empire
-    for emperor in [augustus, tiberius, caligula, claudius, nero, galba, otho, vitellius, 
-                   vespasian, titus, domitian, nerva, trajan, hadrian, antoninus_pius, 
-                   marcus_aurelius, commodus, septimius_severus, caracalla, diocletian, constantine]:
-        empire.add_emperor(emperor)
+    empire.add_emperors(succession + [septimius_severus, caracalla, diocletian, constantine])
     
     # Set successors
-    augustus.successor = tiberius
-    tiberius.successor = caligula
-    caligula.successor = claudius
-    claudius.successor = nero
-    nero.successor = galba
-    galba.successor = otho
-    otho.successor = vitellius
-    vitellius.successor = vespasian
-    vespasian.successor = titus
-    titus.successor = domitian
-    domitian.successor = nerva
-    nerva.successor = trajan
-    trajan.successor = hadrian
-    hadrian.successor = antoninus_pius
-    antoninus_pius.successor = marcus_aurelius
-    marcus_aurelius.successor = commodus
+    empire.link_chain(succession)
     
     return empire
 
@@ -613,57 +792,59 @@ def main():
     """Main function to demonstrate the functionality."""
     roman_empire = create_roman_empire()
     
-    print("=== ROMAN EMPERORS DATABASE ===")
-    print(f"Total emperors in database: {len(roman_empire.emperors)}")
-    print(f"Dynasties: {', '.join(sorted(roman_empire.dynasties))}")
-    print("\n")
+    # Collect the report and write it in one go
+    out = []
+    emit = out.append
+    
+    emit("=== ROMAN EMPERORS DATABASE ===")
+    emit(f"Total emperors in database: {len(roman_empire.emperors)}")
+    emit(f"Dynasties: {', '.join(sorted(roman_empire.dynasties))}")
+    emit("\n")
     
     # Example queries
-    print("=== LONGEST REIGNING EMPERORS ===")
+    emit("=== LONGEST REIGNING EMPERORS ===")
     for emperor in roman_empire.get_longest_reigning(3):
-        print(f"{emperor.name}: {emperor.reign_duration()} years")
-    print("\n")
+        emit(f"{emperor.name}: {emperor.reign_duration()} years")
+    emit("\n")
     
-    print("=== JULIO-CLAUDIAN DYNASTY ===")
+    emit("=== JULIO-CLAUDIAN DYNASTY ===")
     for emperor in roman_empire.get_emperors_by_dynasty("Julio-Claudian"):
-        print(emperor.name)
-    print("\n")
+        emit(emperor.name)
+    emit("\n")
     
-    print("=== EMPERORS WHO RULED DURING THE 1ST CENTURY CE ===")
+    emit("=== EMPERORS WHO RULED DURING THE 1ST CENTURY CE ===")
     for emperor in roman_empire.get_emperors_by_period(1, 100):
-        print(f"{emperor.name}: {emperor.reign_start} - {emperor.reign_end} CE")
-    print("\n")
+        emit(f"{emperor.name}: {emperor.reign_start} - {emperor.reign_end} CE")
+    emit("\n")
     
-    print("=== DETAILED INFORMATION ABOUT AUGUSTUS ===")
+    emit("=== DETAILED INFORMATION ABOUT AUGUSTUS ===")
     augustus = roman_empire.get_emperor_by_name("Augustus")
-    print(augustus)
-    print("\n")
+    emit(str(augustus))
+    emit("\n")
     
-    print("=== EMPERORS WHO DIED BY ASSASSINATION ===")
-    assassinated = [emp for emp in roman_empire.emperors 
-                   if emp.cause_of_death and "assassinated" in emp.cause_of_death.lower()]
-    for emperor in assassinated:
-        print(f"{emperor.name}: {emperor.cause_of_death}")
-    print("\n")
+    emit("=== EMPERORS WHO DIED BY ASSASSINATION ===")
+    for emperor in roman_empire._assassinated:
+        emit(f"{emperor.name}: {emperor.cause_of_death}")
+    emit("\n")
     
-    print("=== YOUNGEST EMPERORS AT ACCESSION ===")
+    emit("=== YOUNGEST EMPERORS AT ACCESSION ===")
     for emperor in roman_empire.get_youngest_at_accession(3):
-        print(f"{emperor.name}: {emperor.age_at_accession()} years old")
-    print("\n")
+        emit(f"{emperor.name}: {emperor.age_at_accession()} years old")
+    emit("\n")
     
-    print("=== EMPERORS WITH MOST ACHIEVEMENTS ===")
+    emit("=== EMPERORS WITH MOST ACHIEVEMENTS ===")
     for emperor in roman_empire.get_most_achievements(3):
-        print(f"{emperor.name}: {len(emperor.notable_achievements)} notable achievements")
-    print("\n")
+        emit(f"{emperor.name}: {len(emperor.notable_achievements)} notable achievements")
+    emit("\n")
     
     # New queries for wives and zodiac signs
-    print("=== EMPERORS BY ZODIAC SIGN ===")
-    zodiac_signs = set(emperor.zodiac for emperor in roman_empire.emperors if emperor.zodiac)
-    for sign in sorted(zodiac_signs):
-        emperors = roman_empire.get_emperors_by_zodiac(sign)
-        emperor_names = [emp.name for emp in emperors]
-        print(f"{sign}: {', '.join(emperor_names)}")
-    print("\n")
+    emit("=== EMPERORS BY ZODIAC SIGN ===")
+    zodiac_groups = roman_empire.group_by_zodiac()
+    for sign in sorted(zodiac_groups):
+        emperor_names = [emp.name for emp in zodiac_groups[sign]]
+        emit(f"{sign}: {', '.join(emperor_names)}")
+    emit("\n")
+    sys.stdout.write("\n".join(out) + "\n")
     
     # Add emperor lookup by year
     while True: